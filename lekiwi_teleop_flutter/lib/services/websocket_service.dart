@@ -1,6 +1,7 @@
 import 'dart:async';
 import 'dart:convert';
 import 'dart:io';
+import 'dart:typed_data';
 import 'package:flutter/foundation.dart';
 import 'package:shelf/shelf_io.dart' as shelf_io;
 import 'package:shelf_web_socket/shelf_web_socket.dart';
@@ -37,6 +38,25 @@ class WebSocketService {
   static const double maxRotationVel = 60.0;
   static const double maxWristFlexVel = 1.0;
 
+  // Binary observation frame:
+  // u8 frame type | u32 frame id | u64 timestamp (ns) | u32 metadata length | metadata JSON | JPEG payloads
+  static const int _observationFrameType = 0x01;
+  static const int _frameHeaderSize = 17;
+
+  // Binary action frame: u8 frame type | 9 x f32 (little-endian) velocities in this order
+  static const int _actionFrameType = 0x02;
+  static const List<String> _actionFrameKeys = [
+    'x.vel',
+    'y.vel',
+    'theta.vel',
+    'wrist_flex.vel',
+    'shoulder_pan.vel',
+    'shoulder_lift.vel',
+    'elbow_flex.vel',
+    'wrist_roll.vel',
+    'gripper.vel',
+  ];
+
   Future<String?> _findLocalIp() async {
     try {
       // List all network interfaces
@@ -97,7 +117,10 @@ class WebSocketService {
         _channel!.stream.listen(
           (message) {
             try {
-              final data = json.decode(message);
+              final data = message is String
+                  ? json.decode(message)
+                  : _decodeObservationFrame(message as List<int>);
+              if (data == null) return;
               debugPrint('📨 Received from robot: ${data['type']}');
               
               // Handle observation data from Python
@@ -128,6 +151,35 @@ class WebSocketService {
     }
   }
 
+  // Decode a binary observation frame into the same map layout as JSON observations,
+  // with image entries holding their raw JPEG bytes in 'data'
+  Map<String, dynamic>? _decodeObservationFrame(List<int> message) {
+    final bytes = message is Uint8List ? message : Uint8List.fromList(message);
+    if (bytes.length < _frameHeaderSize || bytes[0] != _observationFrameType) {
+      debugPrint('❌ Unknown binary frame from robot');
+      return null;
+    }
+
+    final header = ByteData.sublistView(bytes, 0, _frameHeaderSize);
+    final frameId = header.getUint32(1, Endian.little);
+    final timestampNs = header.getUint64(5, Endian.little);
+    final metaLength = header.getUint32(13, Endian.little);
+    final payloadStart = _frameHeaderSize + metaLength;
+    final metaBytes = Uint8List.sublistView(bytes, _frameHeaderSize, payloadStart);
+    final data = json.decode(utf8.decode(metaBytes)) as Map<String, dynamic>;
+    data['frame_id'] = frameId;
+    data['timestamp'] = timestampNs / 1e9;
+
+    final entries = data['data'] as Map<String, dynamic>? ?? {};
+    for (final entry in entries.values) {
+      if (entry is Map<String, dynamic> && entry['type'] == 'image') {
+        final start = payloadStart + (entry['offset'] as int);
+        entry['data'] = Uint8List.sublistView(bytes, start, start + (entry['length'] as int));
+      }
+    }
+    return data;
+  }
+
   // Apply deadzone logic: 0-15% = 0, 15-30% = proportional 0-30%, 30%+ = actual
   double _applyDeadzone(double value) {
     final absValue = value.abs();
@@ -238,20 +290,24 @@ class WebSocketService {
       'gripper.vel': _manipulatorJointVel[5],
     };
     
-    debugPrint('📤 Sending action: ${json.encode(message)}');
-    _sendMessage(message);
-  }
-
-  void _sendManipulatorActionMessage() {
-    // Remove this method - we don't need it anymore
-    // Everything goes through _sendActionMessage()
+    // Only pay for the JSON encode of the log line in debug builds
+    if (kDebugMode) {
+      debugPrint('📤 Sending action: ${json.encode(message)}');
+    }
+    _sendActionFrame(message);
   }
 
-  void _sendMessage(Map<String, dynamic> message) {
+  // Send action as a fixed-layout binary frame so Python doesn't have to parse JSON per command
+  void _sendActionFrame(Map<String, dynamic> message) {
     try {
-      _channel?.sink.add(json.encode(message));
+      final frame = ByteData(1 + 4 * _actionFrameKeys.length);
+      frame.setUint8(0, _actionFrameType);
+      for (var i = 0; i < _actionFrameKeys.length; i++) {
+        frame.setFloat32(1 + 4 * i, (message[_actionFrameKeys[i]] as num).toDouble(), Endian.little);
+      }
+      _channel?.sink.add(frame.buffer.asUint8List());
     } catch (e) {
-      debugPrint('❌ Error sending message: $e');
+      debugPrint('❌ Error sending action frame: $e');
     }
   }
 
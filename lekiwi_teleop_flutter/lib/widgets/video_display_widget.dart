@@ -56,10 +56,10 @@ class VideoDisplayWidget extends StatelessWidget {
       );
     }
 
-    // Decode base64 image data
+    // Image data arrives as raw JPEG bytes (binary frames) or base64 (legacy JSON frames)
     try {
-      final String base64String = imageData['data'] as String;
-      final Uint8List imageBytes = base64Decode(base64String);
+      final payload = imageData['data'];
+      final Uint8List imageBytes = payload is Uint8List ? payload : base64Decode(payload as String);
       
       return Stack(
         children: [
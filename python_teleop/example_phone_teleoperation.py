@@ -23,6 +23,30 @@ from lerobot.common.teleoperators.phone_teleop.teleop_phone import PhoneTeleop
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _tensor_to_numpy(value):
+    # Zero-copy for CPU tensors, device-to-host copy only for tensors living elsewhere
+    return value.detach().cpu().numpy()
+
+def _chw_image_to_numpy(value):
+    # Float frames (0-1 range) are quantized to uint8 on their own device, so a GPU frame moves
+    # a quarter of the bytes to the host
+    if value.is_floating_point():
+        value = (value.detach() * 255).round_().clamp_(0, 255).to(torch.uint8)
+    # Channel-first frames become a zero-copy HWC view, the encoder makes it contiguous off the control loop
+    return value.detach().cpu().permute(1, 2, 0).numpy()
+
+def _passthrough(value):
+    return value
+
+def _converter_for(value):
+    """Pick the conversion needed to send an observation value to the phone."""
+    if not isinstance(value, torch.Tensor):
+        return _passthrough
+    is_image_dtype = value.dtype == torch.uint8 or value.is_floating_point()
+    if value.ndim == 3 and is_image_dtype and value.shape[0] in (1, 3) and value.shape[2] not in (1, 3):
+        return _chw_image_to_numpy
+    return _tensor_to_numpy
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--robot-ip', type=str, default="192.168.1.1", help='IP address of the LeKiwi robot')
@@ -61,6 +85,13 @@ def main():
         logger.info("Starting teleoperation loop...")
         logger.info("Phone controls: Base movement + all 6 arm joints")
         
+        # Per-key converters, resolved once since the observation layout doesn't change between ticks
+        converters = {}
+        
+        # Fixed-rate loop: sleep until the next deadline instead of a fixed delay so work time doesn't add up
+        period = 0.02  # 50 Hz
+        next_t = time.monotonic() + period
+        
         # Main control loop
         while True:
             # Get real robot observation
@@ -69,10 +100,10 @@ def main():
             # Convert torch tensors to numpy for phone transmission
             processed_observation = {}
             for key, value in observation.items():
-                if isinstance(value, torch.Tensor):
-                    processed_observation[key] = value.numpy()
-                else:
-                    processed_observation[key] = value
+                convert = converters.get(key)
+                if convert is None:
+                    convert = converters[key] = _converter_for(value)
+                processed_observation[key] = convert(value)
             
             # Send observation to phone
             phone_teleop.send_feedback(processed_observation)
@@ -82,13 +113,19 @@ def main():
             robot_action = phone_teleop.get_action()
             robot.send_action(robot_action)
             
-            # Small delay to avoid overwhelming the system
-            time.sleep(0.02)  # 50 Hz
+            sleep_for = next_t - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+                next_t += period
+            else:
+                # Overran the tick, resync instead of trying to catch up with a burst of iterations
+                logger.debug("Control loop overran its period by %.1f ms", -sleep_for * 1000)
+                next_t = time.monotonic() + period
             
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received. Exiting...")
     except Exception as e:
-        logger.error(f"Error occurred: {e}")
+        logger.error("Error occurred: %s", e)
         import traceback
         traceback.print_exc()
     finally:
@@ -26,9 +26,22 @@ class PhoneTeleopConfig(TeleoperatorConfig):
     
     # Video streaming settings
     video_quality: int = 80  # JPEG quality 0-100 for compressing camera feeds
+    stream_width: int | None = None   # Resize camera feeds to this size before encoding (None keeps the
+    stream_height: int | None = None  # camera resolution); smaller frames encode and transfer faster
+    image_colorspace: str = "rgb"  # Channel order of camera feeds, "rgb" or "bgr"
+    adaptive_video_quality: bool = True  # Lower JPEG quality while sends back up, restore when the link recovers
+    min_video_quality: int = 30          # Lowest JPEG quality adaptive control may use
+    target_send_time_s: float = 0.05     # Sends slower than this are treated as a congested link
+    max_feedback_fps: float | None = 30.0  # Observations sent more often are skipped (None sends all of them)
     
     # Control settings (updated to match app limits)
     max_linear_velocity: float = 0.25  # m/s limit for x.vel and y.vel
     max_angular_velocity: float = 60.0  # deg/s limit for theta.vel
     
-    mock: bool = False 
\ No newline at end of file
+    mock: bool = False
+
+    def __post_init__(self):
+        if (self.stream_width is None) != (self.stream_height is None):
+            raise ValueError("stream_width and stream_height must be set together (or both left as None)")
+        if self.image_colorspace not in ("rgb", "bgr"):
+            raise ValueError(f"image_colorspace must be 'rgb' or 'bgr', got {self.image_colorspace!r}") 
\ No newline at end of file
@@ -1,12 +1,12 @@
 #!/usr/bin/env python
 
 import asyncio
-import base64
 import json
 import logging
+import struct
 import threading
 import time
-from queue import Empty, Queue
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import cv2
@@ -14,6 +14,40 @@ import numpy as np
 import torch
 import websockets
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:  # uvloop is unavailable on Windows or not installed
+    _new_event_loop = asyncio.new_event_loop
+
+try:
+    from numba import njit
+except ImportError:  # Fall back to the numpy implementation
+    njit = None
+
+try:
+    import torchvision
+    from torchvision.io import encode_jpeg
+
+    # nvJPEG encoding of CUDA tensors was added in torchvision 0.19
+    _tv_version = tuple(int(part) for part in torchvision.__version__.split("+")[0].split(".")[:2])
+    _encode_jpeg_cuda = encode_jpeg if _tv_version >= (0, 19) else None
+except ImportError:  # Fall back to encoding CUDA frames on the CPU
+    _encode_jpeg_cuda = None
+
+try:
+    from turbojpeg import TJFLAG_FASTDCT, TJPF_BGR, TJPF_RGB, TJSAMP_420, TurboJPEG
+
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # PyTurboJPEG not installed or libturbojpeg not found
+    _turbojpeg = None
+
 from lerobot.common.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.common.teleoperators.teleoperator import Teleoperator
 
@@ -21,6 +55,209 @@ from .configuration_phone import PhoneTeleopConfig
 
 logger = logging.getLogger(__name__)
 
+# Binary observation frame:
+#   u8 frame type | u32 frame id | u64 timestamp (ns since epoch) | u32 metadata length | metadata JSON | JPEGs
+# Image entries in the metadata point at their JPEG bytes by offset/length into the payload section.
+_OBSERVATION_FRAME = 0x01
+_FRAME_HEADER = struct.Struct("<BIQI")
+
+# Binary action frame from the phone: u8 frame type | 9 x f32 velocities in _ACTION_FRAME_KEYS order
+_ACTION_FRAME = 0x02
+_ACTION_FRAME_KEYS = (
+    "x.vel",
+    "y.vel",
+    "theta.vel",
+    "wrist_flex.vel",
+    "shoulder_pan.vel",
+    "shoulder_lift.vel",
+    "elbow_flex.vel",
+    "wrist_roll.vel",
+    "gripper.vel",
+)
+_ACTION_STRUCT = struct.Struct(f"<B{len(_ACTION_FRAME_KEYS)}f")
+
+# Arm joints in the order used by the position/limit arrays
+ARM_JOINTS = ("shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper")
+_JOINT_VEL_KEYS = tuple(f"{joint}.vel" for joint in ARM_JOINTS)
+_JOINT_POS_KEYS = tuple(f"arm_{joint}.pos" for joint in ARM_JOINTS)
+_BASE_VEL_KEYS = ("x.vel", "y.vel", "theta.vel")
+
+# Longest time step a single get_action call integrates joint velocities over
+_MAX_INTEGRATION_DT_S = 0.1
+
+# Velocity commands are kept as one array: base velocities first, then arm joints in ARM_JOINTS order,
+# so the joint velocities are a contiguous view that feeds the integrator directly
+_VELOCITY_KEYS = _BASE_VEL_KEYS + _JOINT_VEL_KEYS
+_NUM_BASE_VELS = len(_BASE_VEL_KEYS)
+# Positions of _VELOCITY_KEYS within a binary action frame
+_ACTION_FRAME_ORDER = np.array([_ACTION_FRAME_KEYS.index(key) for key in _VELOCITY_KEYS])
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# dtypes orjson serializes natively with OPT_SERIALIZE_NUMPY (float16 is left out, older orjson rejects it)
+_ORJSON_NUMPY_DTYPES = frozenset(
+    np.dtype(name)
+    for name in ("bool", "int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64",
+                 "float32", "float64")
+)
+
+
+def _json_array(value: np.ndarray) -> Any:
+    """Return an array in a form `_json_dumps` can serialize, skipping the list conversion when possible."""
+    # orjson rejects 0-d arrays, tolist() turns them into plain scalars
+    if orjson is not None and value.ndim > 0 and value.flags.c_contiguous and value.dtype in _ORJSON_NUMPY_DTYPES:
+        # orjson reads the array buffer directly instead of going through boxed Python floats
+        return value
+    return value.tolist()
+
+
+def _decode_action_frame(frame: bytes) -> np.ndarray:
+    """Decode a binary action frame into a velocity array ordered as _VELOCITY_KEYS."""
+    if len(frame) != _ACTION_STRUCT.size or frame[0] != _ACTION_FRAME:
+        raise ValueError(f"unexpected binary frame (type {frame[0] if frame else None}, {len(frame)} bytes)")
+    velocities = np.frombuffer(frame, dtype="<f4", offset=1)
+    return velocities[_ACTION_FRAME_ORDER].astype(np.float64)
+
+
+def _parse_action_message(data: dict[str, Any]) -> np.ndarray:
+    """Read the velocities of a JSON action message into an array ordered as _VELOCITY_KEYS."""
+    return np.fromiter(
+        (data.get(key, 0.0) for key in _VELOCITY_KEYS), dtype=np.float64, count=len(_VELOCITY_KEYS)
+    )
+
+
+def _integrate_joint_positions_numpy(
+    positions: np.ndarray, velocities: np.ndarray, dt: float, lower: np.ndarray, upper: np.ndarray
+) -> None:
+    """Integrate joint velocities into positions in place, keeping them within joint limits."""
+    moving = np.abs(velocities) > 0.01  # Only update joints with significant velocity
+    positions += np.where(moving, velocities * dt * 60.0, 0.0)  # Scale factor
+    np.clip(positions, lower, upper, out=positions)
+
+
+def _integrate_joint_positions_loop(positions, velocities, dt, lower, upper):
+    """Same as `_integrate_joint_positions_numpy`, written as a scalar loop for Numba to compile."""
+    scale = dt * 60.0  # Scale factor
+    for i in range(positions.shape[0]):
+        velocity = velocities[i]
+        # Only update joints with significant velocity; written as a select plus min/max so the
+        # compiled loop has no data-dependent branches (positions always start within limits)
+        step = velocity * scale if abs(velocity) > 0.01 else 0.0
+        positions[i] = min(max(positions[i] + step, lower[i]), upper[i])
+
+
+if njit is not None:
+    # Compiled straight-line loop avoids the per-call overhead of several small numpy ufuncs
+    _integrate_joint_positions = njit(cache=True)(_integrate_joint_positions_loop)
+else:
+    _integrate_joint_positions = _integrate_joint_positions_numpy
+
+
+def _encode_image(
+    image: np.ndarray, quality: int, size: tuple[int, int] | None = None, bgr: bool = False
+) -> bytes | np.ndarray:
+    """JPEG-encode a camera image (RGB, or BGR if `bgr`), optionally resized to `size` (width, height) first.
+    
+    Returns the JPEG as bytes or as a 1-D uint8 array; both are joined into the frame without a copy.
+    """
+    # Strided views (e.g. permuted channel-first tensors) are compacted here, off the event loop
+    image = np.ascontiguousarray(image)
+    if size is not None and (image.shape[1], image.shape[0]) != size:
+        # Encode cost scales with pixel count, INTER_AREA keeps downscaled frames free of aliasing
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        if image.ndim == 2:  # cv2.resize drops the channel axis of single-channel images
+            image = image[:, :, None]
+    # PyTurboJPEG doesn't check the dtype, so only 8-bit frames take this path; cv2 converts the rest
+    if _turbojpeg is not None and image.dtype == np.uint8 and image.shape[2] == 3:
+        # libjpeg-turbo takes RGB or BGR directly, so no color conversion pass is needed
+        return _turbojpeg.encode(
+            image,
+            quality=quality,
+            pixel_format=TJPF_BGR if bgr else TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+            flags=TJFLAG_FASTDCT,
+        )
+    
+    # Convert RGB to BGR since camera frames are usually RGB but cv2.imencode expects BGR
+    if not bgr and image.shape[2] == 3:  # Only if it has 3 channels
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    _, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return buffer.reshape(-1)
+
+
+def _encode_image_cuda(
+    image: torch.Tensor, quality: int, size: tuple[int, int] | None = None, bgr: bool = False
+) -> np.ndarray:
+    """JPEG-encode a 3-channel uint8 HWC camera image living on a CUDA device, so only the JPEG is copied to host."""
+    image = image.permute(2, 0, 1)  # encode_jpeg expects channel-first
+    if bgr:
+        image = image.flip(0)  # encode_jpeg expects RGB
+    if size is not None and (image.shape[2], image.shape[1]) != size:
+        # Area interpolation matches the cv2.INTER_AREA downscale of the CPU path
+        resized = torch.nn.functional.interpolate(image[None].float(), size=(size[1], size[0]), mode="area")
+        image = resized[0].round_().to(torch.uint8)
+    return _encode_jpeg_cuda(image.contiguous(), quality=quality).cpu().numpy()
+
+
+def _encode_tensor_image(
+    image: torch.Tensor, quality: int, size: tuple[int, int] | None = None, bgr: bool = False
+) -> bytes | np.ndarray:
+    """JPEG-encode an HWC camera image tensor on the CPU, copying it to host first if needed."""
+    return _encode_image(image.detach().cpu().numpy(), quality, size, bgr)
+
+
+# Encoder for each image entry type; CUDA images are encoded on the GPU instead of copying the raw frame to host
+_IMAGE_ENCODERS = {
+    "image": _encode_image,
+    "tensor_image": _encode_tensor_image,
+    "cuda_image": _encode_image_cuda,
+}
+
+
+def _classify_observation_value(value: Any) -> tuple[str, bool]:
+    """Decide how an observation value is sent to the phone.
+    
+    Returns the message entry type ("image", "tensor_image", "cuda_image", "state", "array", "scalar"
+    or "string") and whether the value is a torch tensor that must be converted to numpy first.
+    """
+    if isinstance(value, torch.Tensor):
+        if value.ndim == 3:
+            if (
+                _encode_jpeg_cuda is not None
+                and value.is_cuda
+                and value.dtype == torch.uint8
+                and value.shape[2] == 3  # nvJPEG only encodes 3-channel images
+            ):
+                return "cuda_image", False
+            # Converted in the encode pool, so a device-to-host copy doesn't block the event loop
+            return "tensor_image", False
+        from_tensor = True
+    elif isinstance(value, np.ndarray):
+        from_tensor = False
+    elif isinstance(value, (int, float)):
+        return "scalar", False
+    else:
+        return "string", False
+    
+    if value.ndim == 3:
+        return "image", from_tensor
+    if value.ndim == 1:
+        return "state", from_tensor
+    return "array", from_tensor
+
 
 class PhoneTeleop(Teleoperator):
     """
@@ -46,38 +283,59 @@ class PhoneTeleop(Teleoperator):
         self.client_task = None
         self.websocket_thread = None
         
-        # Communication queues
-        self.action_queue = Queue(maxsize=10)
-        self.observation_queue = Queue(maxsize=10)
+        # Worker threads for JPEG encoding (cv2 releases the GIL while encoding)
+        self._encode_pool = None
         
-        # Current action state (velocity commands from phone)
-        self.current_velocity_action = {
-            "x.vel": 0.0,           # Linear velocity X (forward/backward) 
-            "y.vel": 0.0,           # Linear velocity Y (left/right)
-            "theta.vel": 0.0,       # Angular velocity (rotation)
-            "wrist_flex.vel": 0.0,  # Wrist flex velocity
-            # Manipulator joint velocities
-            "shoulder_pan.vel": 0.0,
-            "shoulder_lift.vel": 0.0,
-            "elbow_flex.vel": 0.0,
-            "wrist_roll.vel": 0.0,
-            "gripper.vel": 0.0,
-        }
+        # Most recent observation waiting to be encoded (older ones are overwritten)
+        self._latest_feedback = None
+        self._feedback_ready = None
         
-        # Joint position tracking for all arm joints (integrate velocities to positions)
-        self.current_joint_positions = {
-            "shoulder_pan": 0.0,
-            "shoulder_lift": -90.0, 
-            "elbow_flex": 90.0,
-            "wrist_flex": -50.0,
-            "wrist_roll": -50.0,
-            "gripper": 50.0,
-        }
-        self.last_time = time.time()
+        # Encoded feedback frames waiting to be sent (oldest dropped when full)
+        self._packet_queue = None
+        self._frame_id = 0
+        
+        # Target (width, height) for camera feeds, None to send them at camera resolution
+        if config.stream_width is not None and config.stream_height is not None:
+            self._stream_size = (config.stream_width, config.stream_height)
+        else:
+            self._stream_size = None
+        
+        # Camera feeds that are already BGR skip the RGB to BGR conversion before OpenCV encoding
+        self._bgr_images = config.image_colorspace == "bgr"
+        
+        # Minimum time between observations handed to the encoder (0 forwards every observation)
+        self._feedback_interval_s = 1.0 / config.max_feedback_fps if config.max_feedback_fps else 0.0
+        self._next_feedback_t = 0.0
+        
+        # Per-key (value type, entry type, from tensor) for observations, see _classify_observation_value
+        self._observation_kinds = {}
+        
+        # JPEG quality currently used for feedback, adapted to the measured send time
+        self._video_quality = config.video_quality
+        self._fast_sends = 0
+        
+        # Latest velocity commands from phone, ordered as _VELOCITY_KEYS: base x/y/theta velocities
+        # followed by the arm joint velocities. The WebSocket thread publishes each command by replacing
+        # the array (a single atomic reference assignment) and never modifies it afterwards
+        self._velocities = np.zeros(len(_VELOCITY_KEYS))
+        
+        # Joint position tracking for all arm joints, ordered as ARM_JOINTS (integrate velocities to positions)
+        self._joint_positions = np.array([0.0, -90.0, 90.0, -50.0, -50.0, 50.0])
+        # Joint limits: gripper is 0-100, all other joints are -100-100
+        self._joint_lower = np.array([-100.0, -100.0, -100.0, -100.0, -100.0, 0.0])
+        self._joint_upper = np.full(len(ARM_JOINTS), 100.0)
+        self._last_time_ns = time.monotonic_ns()
+        
+        # Base velocity limits (x, y, theta), cached for the per-message clamp
+        self._base_velocity_limits = np.array(
+            [config.max_linear_velocity, config.max_linear_velocity, config.max_angular_velocity], dtype=np.float64
+        )
         
         # Connection state
         self._connected = False
         self._phone_connected = False
+        # Set by the WebSocket thread once the phone connection is open, so connect() can wait without polling
+        self._phone_connected_event = threading.Event()
         self.logs = {}
 
     @property
@@ -102,6 +360,16 @@ class PhoneTeleop(Teleoperator):
         """No feedback features needed for phone teleop."""
         return {}
 
+    @property
+    def current_velocity_action(self) -> dict[str, float]:
+        """Snapshot of the latest velocity commands from phone, keyed like the action messages."""
+        return dict(zip(_VELOCITY_KEYS, self._velocities.tolist()))
+
+    @property
+    def current_joint_positions(self) -> dict[str, float]:
+        """Snapshot of the integrated arm joint positions, keyed by joint name."""
+        return dict(zip(ARM_JOINTS, self._joint_positions.tolist()))
+
     @property
     def is_connected(self) -> bool:
         """Check if teleoperator is connected to phone."""
@@ -119,21 +387,27 @@ class PhoneTeleop(Teleoperator):
                 "Phone teleoperator is already connected. Do not run `connect()` twice."
             )
 
-        logger.info(f"Connecting to phone at {self.config.phone_ip}:{self.config.phone_port}")
+        logger.info("Connecting to phone at %s:%s", self.config.phone_ip, self.config.phone_port)
+        
+        # Compile the joint integrator now (no-op without Numba) so the first teleop tick doesn't stall
+        _integrate_joint_positions(
+            self._joint_positions.copy(), np.zeros(len(ARM_JOINTS)), 0.0, self._joint_lower, self._joint_upper
+        )
         
         self._connected = True
+        self._phone_connected_event.clear()
+        self._encode_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="phone_encode")
         
         # Start WebSocket client in separate thread
         self.websocket_thread = threading.Thread(target=self._start_websocket_client, daemon=True)
         self.websocket_thread.start()
         
         # Wait for connection to be established
-        start_time = time.time()
-        while not self._phone_connected and (time.time() - start_time) < self.config.connection_timeout_s:
-            time.sleep(0.1)
+        self._phone_connected_event.wait(self.config.connection_timeout_s)
             
         if not self._phone_connected:
             self._connected = False
+            self._encode_pool.shutdown(wait=False)
             raise DeviceNotConnectedError(
                 f"Failed to connect to phone at {self.config.phone_ip}:{self.config.phone_port} "
                 f"within {self.config.connection_timeout_s}s"
@@ -143,13 +417,13 @@ class PhoneTeleop(Teleoperator):
 
     def _start_websocket_client(self):
         """Start WebSocket client in its own event loop."""
-        self.loop = asyncio.new_event_loop()
+        self.loop = _new_event_loop()
         asyncio.set_event_loop(self.loop)
         
         try:
             self.loop.run_until_complete(self._websocket_client())
         except Exception as e:
-            logger.error(f"WebSocket client error: {e}")
+            logger.error("WebSocket client error: %s", e)
         finally:
             self._phone_connected = False
 
@@ -159,83 +433,76 @@ class PhoneTeleop(Teleoperator):
         
         while self._connected:
             try:
-                async with websockets.connect(uri) as websocket:
+                # JPEG frames don't deflate, so skip permessage-deflate; a small write limit makes sends
+                # wait for the socket to drain, which lets the drop-oldest packet queue absorb congestion
+                async with websockets.connect(uri, compression=None, write_limit=2**15) as websocket:
                     self.websocket = websocket
+                    self._latest_feedback = None
+                    self._feedback_ready = asyncio.Event()
+                    self._packet_queue = asyncio.Queue(maxsize=2)
+                    self._video_quality = self.config.video_quality
+                    self._fast_sends = 0
                     self._phone_connected = True
+                    self._phone_connected_event.set()
                     logger.info("WebSocket connection established")
                     
-                    # Handle incoming messages
-                    async for message in websocket:
-                        await self._process_message(message)
+                    # Encode the latest observation and send encoded frames from separate tasks
+                    # so neither a slow encode nor a slow link stalls command handling
+                    feedback_tasks = [
+                        asyncio.create_task(self._feedback_encoder()),
+                        asyncio.create_task(self._feedback_sender(websocket)),
+                    ]
+                    try:
+                        # Handle incoming messages
+                        async for message in websocket:
+                            await self._process_message(message)
+                    finally:
+                        for task in feedback_tasks:
+                            task.cancel()
                         
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("Phone disconnected")
                 self._phone_connected = False
                 
             except Exception as e:
-                logger.error(f"WebSocket connection error: {e}")
+                logger.error("WebSocket connection error: %s", e)
                 self._phone_connected = False
                 
             if self._connected:
-                logger.info(f"Reconnecting in {self.config.reconnect_interval_s}s...")
+                logger.info("Reconnecting in %ss...", self.config.reconnect_interval_s)
                 await asyncio.sleep(self.config.reconnect_interval_s)
 
-    async def _process_message(self, message: str):
+    async def _process_message(self, message: str | bytes):
         """Process incoming message from phone."""
         try:
-            data = json.loads(message)
-            message_type = data.get("type")
-            
-            if message_type == "action":
+            if isinstance(message, bytes):
+                # Fixed-layout binary action frame, no JSON parsing needed
+                velocities = _decode_action_frame(message)
+            else:
+                data = _json_loads(message)
+                if data.get("type") != "action":
+                    return
                 # Receive ALL commands from phone in single action message
-                x_vel = data.get("x.vel", 0.0)
-                y_vel = data.get("y.vel", 0.0)  
-                theta_vel = data.get("theta.vel", 0.0)
-                wrist_flex_vel = data.get("wrist_flex.vel", 0.0)
-                
-                # Get individual joint velocities
-                shoulder_pan_vel = data.get("shoulder_pan.vel", 0.0)
-                shoulder_lift_vel = data.get("shoulder_lift.vel", 0.0)
-                elbow_flex_vel = data.get("elbow_flex.vel", 0.0)
-                wrist_roll_vel = data.get("wrist_roll.vel", 0.0)
-                gripper_vel = data.get("gripper.vel", 0.0)
-                
-                # Apply velocity limits to base commands
-                x_vel = max(-self.config.max_linear_velocity, 
-                           min(self.config.max_linear_velocity, x_vel))
-                y_vel = max(-self.config.max_linear_velocity,
-                           min(self.config.max_linear_velocity, y_vel))
-                theta_vel = max(-self.config.max_angular_velocity,
-                               min(self.config.max_angular_velocity, theta_vel))
-                
-                # Update current action with ALL commands
-                self.current_velocity_action = {
-                    "x.vel": x_vel,
-                    "y.vel": y_vel,
-                    "theta.vel": theta_vel,
-                    "wrist_flex.vel": wrist_flex_vel,
-                    "shoulder_pan.vel": shoulder_pan_vel,
-                    "shoulder_lift.vel": shoulder_lift_vel,
-                    "elbow_flex.vel": elbow_flex_vel,
-                    "wrist_roll.vel": wrist_roll_vel,
-                    "gripper.vel": gripper_vel,
-                }
-                
-                # Log non-zero joint velocities only
-                active_joints = {k: v for k, v in self.current_velocity_action.items() if abs(v) > 0.001}
-                if active_joints:
-                    logger.info(f"🎯 Active commands: {active_joints}")
-                
-                # Put action in queue for main thread
-                try:
-                    self.action_queue.put_nowait(self.current_velocity_action.copy())
-                except:
-                    pass  # Queue full, skip
+                velocities = _parse_action_message(data)
+            
+            # Apply velocity limits to base commands
+            limits = self._base_velocity_limits
+            base_velocities = velocities[:_NUM_BASE_VELS]
+            np.clip(base_velocities, -limits, limits, out=base_velocities)
+            
+            # Log non-zero joint velocities only (skip building the dict when INFO is filtered out
+            # or when a single vector test shows the phone is idle)
+            if logger.isEnabledFor(logging.INFO) and (np.abs(velocities) > 0.001).any():
+                active_joints = {k: v for k, v in zip(_VELOCITY_KEYS, velocities.tolist()) if abs(v) > 0.001}
+                logger.info("🎯 Active commands: %s", active_joints)
+            
+            # Publish for main thread, only the latest command matters
+            self._velocities = velocities
                     
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON from phone: {e}")
+            logger.error("Invalid JSON from phone: %s", e)
         except Exception as e:
-            logger.error(f"Error processing phone message: {e}")
+            logger.error("Error processing phone message: %s", e)
 
     def calibrate(self) -> None:
         """No calibration needed for phone teleop."""
@@ -254,54 +521,24 @@ class PhoneTeleop(Teleoperator):
                 "Phone teleoperator is not connected. You need to run `connect()` before `get_action()`."
             )
 
-        # Get latest action from queue, or use current action
-        try:
-            while True:
-                self.current_velocity_action = self.action_queue.get_nowait()
-        except Empty:
-            pass  # Use last known action
-
         # Integrate joint velocities to positions
-        current_time = time.time()
-        dt = current_time - self.last_time
-        self.last_time = current_time
+        # Monotonic clock so wall-clock adjustments can't produce a huge dt, which is also capped
+        # so a stall between calls can't fling joints to their limits
+        current_time_ns = time.monotonic_ns()
+        dt = min((current_time_ns - self._last_time_ns) * 1e-9, _MAX_INTEGRATION_DT_S)
+        self._last_time_ns = current_time_ns
         
-        # Extract joint velocities from current action
-        joint_velocities = {
-            "shoulder_pan": self.current_velocity_action["shoulder_pan.vel"],
-            "shoulder_lift": self.current_velocity_action["shoulder_lift.vel"],
-            "elbow_flex": self.current_velocity_action["elbow_flex.vel"],
-            "wrist_flex": self.current_velocity_action["wrist_flex.vel"],
-            "wrist_roll": self.current_velocity_action["wrist_roll.vel"],
-            "gripper": self.current_velocity_action["gripper.vel"],
-        }
+        # Read the latest command once, the WebSocket thread may replace it while we work
+        velocities = self._velocities
         
-        # Integrate velocities to positions for all joints
-        for joint_name, velocity in joint_velocities.items():
-            if abs(velocity) > 0.01:  # Only update if significant velocity
-                # Integrate velocity to position
-                self.current_joint_positions[joint_name] += velocity * dt * 60  # Scale factor
-                
-                # Apply joint limits
-                if joint_name == "gripper":
-                    self.current_joint_positions[joint_name] = max(0, min(100, self.current_joint_positions[joint_name]))
-                else:
-                    self.current_joint_positions[joint_name] = max(-100, min(100, self.current_joint_positions[joint_name]))
+        # Integrate velocities to positions for all joints, within joint limits
+        _integrate_joint_positions(
+            self._joint_positions, velocities[_NUM_BASE_VELS:], dt, self._joint_lower, self._joint_upper
+        )
         
-        # Create action with joint positions and base velocities
-        action = {
-            # Base movement velocities
-            "x.vel": self.current_velocity_action["x.vel"],
-            "y.vel": self.current_velocity_action["y.vel"], 
-            "theta.vel": self.current_velocity_action["theta.vel"],
-            # Manipulator joint positions
-            "arm_shoulder_pan.pos": self.current_joint_positions["shoulder_pan"],
-            "arm_shoulder_lift.pos": self.current_joint_positions["shoulder_lift"], 
-            "arm_elbow_flex.pos": self.current_joint_positions["elbow_flex"],
-            "arm_wrist_flex.pos": self.current_joint_positions["wrist_flex"],
-            "arm_wrist_roll.pos": self.current_joint_positions["wrist_roll"],
-            "arm_gripper.pos": self.current_joint_positions["gripper"],
-        }
+        # Create action with base velocities and joint positions
+        action = dict(zip(_BASE_VEL_KEYS, velocities[:_NUM_BASE_VELS].tolist()))
+        action.update(zip(_JOINT_POS_KEYS, self._joint_positions.tolist()))
 
         self.logs["read_pos_dt_s"] = time.perf_counter() - before_read_t
         
@@ -311,91 +548,140 @@ class PhoneTeleop(Teleoperator):
         """Send robot observation to phone."""
         if not self._phone_connected or not self.websocket:
             return
+        
+        # Observations beyond the feedback frame rate would only be dropped later, so skip them before any work
+        now = time.monotonic()
+        if now < self._next_feedback_t:
+            return
+        # Advance by a whole interval so callers at a rate that isn't a multiple of the cap still reach it,
+        # resyncing after a gap instead of forwarding a burst
+        self._next_feedback_t += self._feedback_interval_s
+        if self._next_feedback_t <= now:
+            self._next_feedback_t = now + self._feedback_interval_s
             
         try:
-            # Send observation asynchronously
-            asyncio.run_coroutine_threadsafe(
-                self._send_observation_async(observation), 
-                self.loop
-            )
+            # Hand the observation to the encoder task, replacing any frame it hasn't picked up yet
+            self.loop.call_soon_threadsafe(self._post_feedback, observation)
         except Exception as e:
-            logger.error(f"Error sending observation to phone: {e}")
+            logger.error("Error sending observation to phone: %s", e)
+
+    def _post_feedback(self, observation: dict[str, Any]) -> None:
+        """Store the latest observation for the encoder task (runs on the event loop thread)."""
+        if self._feedback_ready is None:
+            return
+        self._latest_feedback = observation
+        self._feedback_ready.set()
+
+    async def _feedback_encoder(self):
+        """Encode the most recent observation whenever a new one arrives."""
+        while True:
+            await self._feedback_ready.wait()
+            self._feedback_ready.clear()
+            observation, self._latest_feedback = self._latest_feedback, None
+            await self._send_observation_async(observation)
 
     async def _send_observation_async(self, observation: dict[str, Any]):
-        """Send observation to phone via WebSocket."""
+        """Encode observation and queue it for sending to phone."""
         try:
+            timestamp_ns = time.time_ns()
             message = {
                 "type": "observation",
-                "timestamp": time.time(),
+                "video_quality": self._video_quality,
                 "data": {}
             }
             
+            # JPEG encodes are dispatched to the encode pool so they run in parallel
+            # and don't block the event loop that also receives phone commands
+            loop = asyncio.get_running_loop()
+            image_keys = []
+            image_jobs = []
+            encode_args = (self._video_quality, self._stream_size, self._bgr_images)
+            
             # Process observation data
+            kinds = self._observation_kinds
+            data = message["data"]
             for key, value in observation.items():
-                if isinstance(value, torch.Tensor):
-                    # Handle torch tensors (convert to numpy first)
-                    value_np = value.numpy()
-                    if value_np.ndim == 3:  # Camera image
-                        # Convert RGB to BGR since torch tensors are usually RGB but cv2.imencode expects BGR
-                        if value_np.shape[2] == 3:  # Only if it has 3 channels
-                            value_np = cv2.cvtColor(value_np, cv2.COLOR_RGB2BGR)
-                        # Convert to JPEG and encode as base64
-                        _, buffer = cv2.imencode('.jpg', value_np, 
-                                              [cv2.IMWRITE_JPEG_QUALITY, self.config.video_quality])
-                        img_base64 = base64.b64encode(buffer).decode('utf-8')
-                        message["data"][key] = {
-                            "type": "image",
-                            "data": img_base64
-                        }
-                    elif value_np.ndim == 1:  # State vector
-                        message["data"][key] = {
-                            "type": "state",
-                            "data": value_np.tolist()
-                        }
-                    else:
-                        message["data"][key] = {
-                            "type": "array", 
-                            "data": value_np.tolist()
-                        }
-                elif isinstance(value, np.ndarray):
-                    if value.ndim == 3:  # Camera image
-                        # If numpy array is RGB, convert to BGR for cv2.imencode
-                        if value.shape[2] == 3:  # Only if it has 3 channels
-                            value = cv2.cvtColor(value, cv2.COLOR_RGB2BGR)
-                        # Convert to JPEG and encode as base64
-                        _, buffer = cv2.imencode('.jpg', value, 
-                                              [cv2.IMWRITE_JPEG_QUALITY, self.config.video_quality])
-                        img_base64 = base64.b64encode(buffer).decode('utf-8')
-                        message["data"][key] = {
-                            "type": "image",
-                            "data": img_base64
-                        }
-                    elif value.ndim == 1:  # State vector
-                        message["data"][key] = {
-                            "type": "state",
-                            "data": value.tolist()
-                        }
-                    else:
-                        message["data"][key] = {
-                            "type": "array", 
-                            "data": value.tolist()
-                        }
-                elif isinstance(value, (int, float)):
-                    message["data"][key] = {
-                        "type": "scalar",
-                        "data": value
-                    }
+                # The observation layout is stable, so each key is classified once and re-checked by type only
+                entry = kinds.get(key)
+                if entry is None or entry[0] is not type(value):
+                    entry = kinds[key] = (type(value), *_classify_observation_value(value))
+                _, kind, from_tensor = entry
+                
+                if from_tensor:
+                    # Handle torch tensors (convert to numpy first, copying to host if they live on a GPU)
+                    value = value.detach().cpu().numpy()
+                
+                encode = _IMAGE_ENCODERS.get(kind)
+                if encode is not None:  # Camera image
+                    image_keys.append(key)
+                    image_jobs.append(loop.run_in_executor(self._encode_pool, encode, value, *encode_args))
+                elif kind == "state" or kind == "array":
+                    data[key] = {"type": kind, "data": _json_array(value)}
+                elif kind == "scalar":
+                    data[key] = {"type": kind, "data": value}
                 else:
                     # Convert other types to string
-                    message["data"][key] = {
-                        "type": "string",
-                        "data": str(value)
-                    }
+                    data[key] = {"type": kind, "data": str(value)}
             
-            await self.websocket.send(json.dumps(message))
+            # Images travel as raw JPEG bytes after the metadata instead of base64 inside the JSON
+            jpegs = await asyncio.gather(*image_jobs)
+            offset = 0
+            for key, jpeg in zip(image_keys, jpegs):
+                data[key] = {
+                    "type": "image",
+                    "offset": offset,
+                    "length": len(jpeg)
+                }
+                offset += len(jpeg)
+            
+            meta = _json_dumps(message)
+            self._frame_id = (self._frame_id + 1) & 0xFFFFFFFF
+            header = _FRAME_HEADER.pack(_OBSERVATION_FRAME, self._frame_id, timestamp_ns, len(meta))
+            packet = b"".join([header, meta, *jpegs])
+            
+            # Stale frames are useless for teleop: drop the oldest one if the sender is behind
+            try:
+                self._packet_queue.put_nowait(packet)
+            except asyncio.QueueFull:
+                self._packet_queue.get_nowait()
+                self._packet_queue.put_nowait(packet)
             
         except Exception as e:
-            logger.error(f"Error in _send_observation_async: {e}")
+            logger.error("Error in _send_observation_async: %s", e)
+
+    async def _feedback_sender(self, websocket):
+        """Send encoded observation frames to phone as they become available."""
+        while True:
+            packet = await self._packet_queue.get()
+            try:
+                send_start = time.perf_counter()
+                await websocket.send(packet)
+                self._adapt_video_quality(time.perf_counter() - send_start)
+            except websockets.exceptions.ConnectionClosed:
+                return
+            except Exception as e:
+                logger.error("Error sending observation to phone: %s", e)
+
+    def _adapt_video_quality(self, send_time_s: float) -> None:
+        """Trade JPEG quality for latency based on how long the last send took."""
+        if not self.config.adaptive_video_quality:
+            return
+        
+        target = self.config.target_send_time_s
+        if send_time_s > 1.2 * target:
+            # Link is backing up: drop quality quickly (never above the configured quality, even if it
+            # is already below min_video_quality)
+            floor = min(self.config.min_video_quality, self.config.video_quality)
+            self._video_quality = max(floor, self._video_quality - 10)
+            self._fast_sends = 0
+        elif send_time_s < 0.5 * target:
+            # Raise quality slowly, only after a sustained run of fast sends
+            self._fast_sends += 1
+            if self._fast_sends >= 30:
+                self._video_quality = min(self.config.video_quality, self._video_quality + 5)
+                self._fast_sends = 0
+        else:
+            self._fast_sends = 0
 
     def disconnect(self) -> None:
         """Disconnect from phone."""
@@ -407,6 +693,7 @@ class PhoneTeleop(Teleoperator):
         logger.info("Disconnecting from phone")
         self._connected = False
         self._phone_connected = False
+        self._phone_connected_event.clear()
         
         # Stop event loop
         if self.loop and not self.loop.is_closed():
@@ -416,4 +703,8 @@ class PhoneTeleop(Teleoperator):
         if self.websocket_thread and self.websocket_thread.is_alive():
             self.websocket_thread.join(timeout=2)
         
+        if self._encode_pool is not None:
+            self._encode_pool.shutdown(wait=False)
+            self._encode_pool = None
+        
         logger.info("Phone teleoperator disconnected") 
\ No newline at end of file